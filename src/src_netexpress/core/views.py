@@ -131,7 +131,11 @@ def health(request):
 @staff_member_required
 def dashboard(request):
     """Tableau de bord interne agrégé."""
-    tasks = Task.objects.all().order_by("-created_at")[:5]
+    Task.refresh_statuses()
+    tasks = (
+        Task.objects.only("title", "status", "due_date")
+        .order_by("-created_at")[:5]
+    )
     quotes = Quote.objects.all().order_by("-issue_date")[:5]
     invoices = Invoice.objects.all().order_by("-issue_date")[:5]
     email_messages = EmailMessage.objects.all().order_by("-created_at")[:5]
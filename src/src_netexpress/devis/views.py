@@ -8,6 +8,7 @@ from django.forms import inlineformset_factory
 from django.http import FileResponse, Http404, JsonResponse, HttpRequest, HttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
+from django.views.decorators.cache import cache_control
 
 from services.models import Service
 from .forms import DevisForm, QuoteRequestForm, QuoteAdminForm, QuoteItemForm
@@ -136,13 +137,15 @@ def admin_quote_edit(request: HttpRequest, pk: int) -> HttpResponse:
     return render(request, "devis/admin_quote_edit.html", context)
 
 
-@login_required
 @staff_member_required
+@cache_control(private=True, max_age=30)
 def service_info(request: HttpRequest, pk: int) -> JsonResponse:
     """Retourne des informations JSON sur un service.
 
     Utilisé par l'éditeur de devis pour préremplir la description
-    lorsqu'un service est sélectionné.
+    lorsqu'un service est sélectionné.  La réponse peut être gardée
+    quelques secondes par le navigateur : resélectionner un même service
+    pendant l'édition ne refait pas l'aller-retour.
     """
     service = get_object_or_404(Service, pk=pk)
     data = {
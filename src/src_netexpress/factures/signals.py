@@ -19,6 +19,8 @@ from django.conf import settings
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from messaging.models import EmailMessage as DbEmailMessage
+
 from .models import Invoice
 
 
@@ -34,11 +36,6 @@ def notify_admin_invoice_created(sender, instance: Invoice, created: bool, **kwa
     if not recipient:
         return
 
-    try:
-        from messaging.models import EmailMessage as DbEmailMessage
-    except Exception:
-        return
-
     num = instance.number or str(instance.pk)
     total = getattr(instance, "total_ttc", "")
     subject = f"[NetExpress] Facture {num} créée"
@@ -101,5 +101,11 @@ def archive(request):
     """
     Affiche toutes les factures avec lien vers téléchargement PDF.
     """
-    invoices = Invoice.objects.exclude(pdf="").order_by("-issue_date", "-number")
+    # Le gabarit affiche ``inv.quote.client.full_name`` pour chaque ligne :
+    # la jointure évite deux requêtes supplémentaires par facture.
+    invoices = (
+        Invoice.objects.exclude(pdf="")
+        .select_related("quote__client")
+        .order_by("-issue_date", "-number")
+    )
     return render(request, "factures/archive.html", {"invoices": invoices})
@@ -0,0 +1,25 @@
+"""Réglages de la suite de tests (``pytest``).
+
+Ces réglages partent de ``base`` et ne gardent que ce dont les tests ont
+besoin : une base SQLite en mémoire, recréée à chaque session.  Le
+schéma est construit directement depuis les modèles (``--nomigrations``
+dans ``pytest.ini``) plutôt qu'en rejouant toutes les migrations.
+"""
+
+import os
+
+# ``base`` exige une clé secrète ; les tests n'en ont pas besoin d'une vraie.
+os.environ.setdefault("DJANGO_SECRET_KEY", "tests-only-insecure-key")
+
+from .base import *  # noqa: E402,F401,F403
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+# Le hachage PBKDF2 par défaut domine le coût de ``create_user`` ; la
+# robustesse des mots de passe n'est pas ce que les tests vérifient.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
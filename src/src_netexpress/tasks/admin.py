@@ -26,10 +26,12 @@ class TaskAdmin(admin.ModelAdmin):
 
     @admin.action(description="Marquer comme terminé les tâches sélectionnées")
     def mark_completed(self, request, queryset):
+        # Les tâches déjà terminées sont écartées en SQL.  Les autres sont
+        # enregistrées une à une (et non via ``update()``) pour que le
+        # signal de changement de statut envoie sa notification.
         updated = 0
-        for task in queryset:
-            if task.status != Task.STATUS_COMPLETED:
-                task.status = Task.STATUS_COMPLETED
-                task.save(update_fields=["status"])
-                updated += 1
+        for task in queryset.exclude(status=Task.STATUS_COMPLETED):
+            task.status = Task.STATUS_COMPLETED
+            task.save(update_fields=["status", "updated_at"])
+            updated += 1
         self.message_user(request, f"{updated} tâche(s) marquée(s) comme terminée(s).")
@@ -0,0 +1,20 @@
+"""Recalcule les statuts des tâches dont l'échéance ou le début est passé.
+
+Le statut n'est mis à jour par :meth:`Task.save` qu'à l'enregistrement ;
+cette commande est destinée à être planifiée (cron, une fois par jour
+après minuit) pour que les pages publiques n'aient pas à écrire en base::
+
+    python manage.py refresh_task_statuses
+"""
+
+from django.core.management.base import BaseCommand
+
+from tasks.models import Task
+
+
+class Command(BaseCommand):
+    help = "Met à jour en une requête les statuts périmés des tâches non terminées."
+
+    def handle(self, *args, **options):
+        updated = Task.refresh_statuses()
+        self.stdout.write(self.style.SUCCESS(f"{updated} tâche(s) mise(s) à jour."))
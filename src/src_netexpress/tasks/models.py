@@ -21,6 +21,9 @@ from __future__ import annotations
 
 from datetime import date
 from django.db import models
+from django.db.models import Case, Q, Value, When
+from django.urls import reverse
+from django.utils import timezone
 
 
 class Task(models.Model):
@@ -79,6 +82,16 @@ class Task(models.Model):
         (STATUS_OVERDUE, "En retard"),
     ]
 
+    # Classes CSS des badges du tableau de bord (``static/css/base.css``).
+    # Les tâches terminées ou en retard ont une classe fixe ; les autres
+    # dépendent de la proximité de l'échéance (voir ``get_status_badge``).
+    STATUS_BADGES = {
+        STATUS_COMPLETED: "badge-traite",
+        STATUS_OVERDUE: "badge-overdue",
+    }
+    BADGE_DUE_SOON = "badge-partial"
+    BADGE_ON_TRACK = "badge-new"
+
     title: str = models.CharField(max_length=200)
     description: str = models.TextField(blank=True)
     location: str = models.CharField(max_length=200, blank=True)
@@ -118,7 +131,6 @@ class Task(models.Model):
         >>> t.get_absolute_url()  # doctest: +SKIP
         '/taches/1/'
         """
-        from django.urls import reverse
         return reverse("tasks:detail", kwargs={"pk": self.pk})
 
     def save(self, *args, **kwargs) -> None:
@@ -144,7 +156,75 @@ class Task(models.Model):
             raise ValueError("La date d'échéance ne peut pas être antérieure à la date de début.")
         super().save(*args, **kwargs)
 
-    def is_due_soon(self, days_threshold: int = 3) -> bool:
+    def days_until_due(self, today: date | None = None) -> int:
+        """Return the number of days left before ``due_date``.
+
+        The value is negative once the deadline has passed.  The
+        difference is computed on proleptic ordinals, which avoids
+        allocating a ``timedelta`` for every task when this helper is
+        called in a loop.
+
+        Parameters
+        ----------
+        today : date, optional
+            Reference date.  Callers iterating over many tasks should
+            compute ``date.today()`` once and pass it here.
+        """
+        if today is None:
+            today = date.today()
+        return self.due_date.toordinal() - today.toordinal()
+
+    @classmethod
+    def refresh_statuses(cls, today: date | None = None) -> int:
+        """Recalculate the date-driven status of every open task.
+
+        :meth:`save` only updates the status when a task is written, so a
+        task whose deadline passes keeps its previous status until the
+        next edit.  This helper applies the same rules to all tasks that
+        are not completed in a single ``UPDATE ... SET status = CASE``
+        statement, restricted to the rows whose status is stale.  Being a
+        ``QuerySet.update`` it does not send ``pre_save``/``post_save``
+        signals.
+
+        Returns the number of updated tasks.
+        """
+        if today is None:
+            today = date.today()
+        overdue = Q(due_date__lt=today)
+        upcoming = Q(due_date__gte=today, start_date__gt=today)
+        in_progress = Q(due_date__gte=today, start_date__lte=today)
+        stale = (
+            (overdue & ~Q(status=cls.STATUS_OVERDUE))
+            | (upcoming & ~Q(status=cls.STATUS_UPCOMING))
+            | (in_progress & ~Q(status=cls.STATUS_IN_PROGRESS))
+        )
+        return (
+            cls.objects.exclude(status=cls.STATUS_COMPLETED)
+            .filter(stale)
+            .update(
+                status=Case(
+                    When(overdue, then=Value(cls.STATUS_OVERDUE)),
+                    When(upcoming, then=Value(cls.STATUS_UPCOMING)),
+                    default=Value(cls.STATUS_IN_PROGRESS),
+                    output_field=models.CharField(),
+                ),
+                updated_at=timezone.now(),
+            )
+        )
+
+    def get_status_badge(self, today: date | None = None) -> str:
+        """Return the CSS class used to display the task status badge.
+
+        Completed and overdue tasks are resolved with a single lookup in
+        :attr:`STATUS_BADGES`; only the remaining tasks compare their
+        :meth:`days_until_due` against the three-day reminder threshold.
+        """
+        badge = self.STATUS_BADGES.get(self.status)
+        if badge is None:
+            badge = self.BADGE_DUE_SOON if self.days_until_due(today) <= 3 else self.BADGE_ON_TRACK
+        return badge
+
+    def is_due_soon(self, days_threshold: int = 3, today: date | None = None) -> bool:
         """Return ``True`` if the task's due date is within ``days_threshold`` days.
 
         Completed tasks always return ``False``.  Tasks with no due date
@@ -157,10 +237,12 @@ class Task(models.Model):
         days_threshold : int
             Number of days before the deadline at which the task is
             considered due soon.
+        today : date, optional
+            Reference date, see :meth:`days_until_due`.
         """
         if self.status == self.STATUS_COMPLETED or not self.due_date:
             return False
-        remaining = (self.due_date - date.today()).days
+        remaining = self.days_until_due(today)
         # Une tâche déjà en retard (``remaining`` négatif) n'est pas « bientôt
         # due » : elle est en retard.  On borne donc l'intervalle à [0, seuil].
         return 0 <= remaining <= days_threshold
@@ -15,7 +15,6 @@ understand what has changed.
 
 from __future__ import annotations
 
-from datetime import date
 from django.conf import settings
 from django.db.models.signals import pre_save, post_save
 from django.dispatch import receiver
@@ -116,7 +115,7 @@ def notify_due_soon(sender, instance: Task, **kwargs) -> None:
     recipient = _get_notification_recipient()
     if not recipient:
         return
-    remaining_days = (instance.due_date - date.today()).days
+    remaining_days = instance.days_until_due()
     subject = f"Rappel : tâche bientôt due — {instance.title}"
     body = (
         f"Bonjour,\n\n"
@@ -8,6 +8,11 @@ from .models import Task
 class TaskListView(ListView):
     """Liste toutes les tâches pour le tableau de bord opérationnel."""
     model = Task
+    # Seules les colonnes affichées dans le tableau sont chargées : la
+    # description (texte libre) et les horodatages ne sont jamais rendus.
+    queryset = Task.objects.only(
+        "title", "status", "start_date", "due_date", "location", "team"
+    )
     template_name = "tasks/task_list.html"
     context_object_name = "tasks"
     ordering = ["-created_at"]
@@ -5,7 +5,7 @@ contrôle l'accès aux vues en fonction des permissions utilisateur.
 """
 
 import pytest
-from django.contrib.auth.models import User, Group
+from django.contrib.auth.models import AnonymousUser, User, Group
 from django.test import RequestFactory
 from django.http import HttpResponse
 
@@ -77,7 +77,6 @@ class TestIsBusinessAdmin:
 
     def test_unauthenticated_user_is_not_business_admin(self):
         """Un utilisateur non authentifié ne doit pas être considéré comme business admin."""
-        from django.contrib.auth.models import AnonymousUser
         assert is_business_admin(AnonymousUser()) is False
 
 
@@ -122,8 +121,6 @@ class TestBusinessAdminRequiredDecorator:
 
     def test_anonymous_user_redirected_to_login(self, request_factory):
         """Un utilisateur anonyme doit être redirigé vers la page de login."""
-        from django.contrib.auth.models import AnonymousUser
-        
         @business_admin_required
         def protected_view(request):
             return HttpResponse("Success")
@@ -0,0 +1,47 @@
+"""Tests des vues de l'application ``factures``.
+
+Vérifie que l'archive des factures charge devis et clients par jointure :
+le nombre de requêtes ne doit pas croître avec le nombre de factures.
+"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+
+from devis.models import Client, Quote
+from factures.models import Invoice
+from factures.views import archive
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def invoices_with_clients():
+    """Crée trois factures avec PDF, chacune liée à un devis et un client."""
+    clients = [
+        Client.objects.create(full_name=f"Client {i}", email=f"client{i}@example.com", phone="0594000000")
+        for i in range(3)
+    ]
+    # ``bulk_create`` n'émet pas ``post_save`` : aucun envoi de devis par
+    # e-mail (ni génération de PDF) à la création.
+    Quote.objects.bulk_create(
+        Quote(client=client, number=f"DEV-2025-{i:03d}")
+        for i, client in enumerate(clients, start=1)
+    )
+    quotes = Quote.objects.order_by("number")
+    return [
+        Invoice.objects.create(quote=quote, pdf=f"factures/facture-{i}.pdf")
+        for i, quote in enumerate(quotes)
+    ]
+
+
+def test_archive_runs_a_single_query(django_assert_num_queries, invoices_with_clients):
+    """L'archive n'émet qu'une requête, quel que soit le nombre de factures."""
+    request = RequestFactory().get("/factures/archive/")
+    request.user = User(username="staff", is_staff=True, is_active=True)
+    with django_assert_num_queries(1):
+        response = archive(request)
+    assert response.status_code == 200
+    for invoice in invoices_with_clients:
+        assert invoice.quote.client.full_name in response.content.decode()
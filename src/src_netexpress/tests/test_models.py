@@ -14,8 +14,10 @@ votre environnement de développement (voir ``requirements/dev.txt``).
 """
 
 import datetime
+import io
 
 import pytest
+from django.core.management import call_command
 from django.urls import reverse
 
 from services.models import Category
@@ -97,4 +99,70 @@ def test_invoice_number_unique() -> None:
     inv1 = Invoice.objects.create(issue_date=today)
     inv2 = Invoice.objects.create(issue_date=today)
     assert inv1.number.endswith("001")
-    assert inv2.number.endswith("002")
\ No newline at end of file
+    assert inv2.number.endswith("002")
+
+
+def test_task_days_until_due() -> None:
+    """``days_until_due`` compte les jours restants, négatif une fois l'échéance passée."""
+    today = datetime.date(2025, 3, 1)
+    task = Task(title="Tailler la haie", due_date=datetime.date(2025, 3, 4))
+    assert task.days_until_due(today) == 3
+    assert task.days_until_due(datetime.date(2025, 3, 6)) == -2
+
+
+@pytest.mark.parametrize(
+    "status,due_offset,expected",
+    [
+        (Task.STATUS_COMPLETED, 10, "badge-traite"),
+        (Task.STATUS_OVERDUE, -2, "badge-overdue"),
+        (Task.STATUS_IN_PROGRESS, 2, Task.BADGE_DUE_SOON),
+        (Task.STATUS_UPCOMING, 10, Task.BADGE_ON_TRACK),
+    ],
+)
+def test_task_get_status_badge(status: str, due_offset: int, expected: str) -> None:
+    """Le badge dépend du statut, puis de la proximité de l'échéance."""
+    today = datetime.date.today()
+    task = Task(
+        title="Nettoyer les vitres",
+        status=status,
+        due_date=today + datetime.timedelta(days=due_offset),
+    )
+    assert task.get_status_badge(today) == expected
+
+
+def test_task_refresh_statuses() -> None:
+    """``refresh_statuses`` corrige en une requête les statuts périmés."""
+    today = datetime.date.today()
+    late = Task.objects.create(title="En retard", due_date=today + datetime.timedelta(days=1))
+    started = Task.objects.create(
+        title="Démarrée",
+        start_date=today + datetime.timedelta(days=1),
+        due_date=today + datetime.timedelta(days=5),
+    )
+    done = Task.objects.create(
+        title="Terminée",
+        status=Task.STATUS_COMPLETED,
+        start_date=today - datetime.timedelta(days=5),
+        due_date=today - datetime.timedelta(days=1),
+    )
+    # Simuler le passage du temps : les statuts enregistrés sont périmés.
+    Task.objects.filter(pk=late.pk).update(due_date=today - datetime.timedelta(days=1))
+    Task.objects.filter(pk=started.pk).update(start_date=today)
+
+    assert Task.refresh_statuses(today) == 2
+    statuses = dict(Task.objects.values_list("pk", "status"))
+    assert statuses[late.pk] == Task.STATUS_OVERDUE
+    assert statuses[started.pk] == Task.STATUS_IN_PROGRESS
+    assert statuses[done.pk] == Task.STATUS_COMPLETED
+    assert Task.refresh_statuses(today) == 0
+
+
+def test_refresh_task_statuses_command() -> None:
+    """La commande planifiée applique ``refresh_statuses`` aux tâches périmées."""
+    today = datetime.date.today()
+    task = Task.objects.create(title="Vitres", due_date=today + datetime.timedelta(days=1))
+    Task.objects.filter(pk=task.pk).update(due_date=today - datetime.timedelta(days=1))
+
+    call_command("refresh_task_statuses", stdout=io.StringIO())
+
+    assert Task.objects.get(pk=task.pk).status == Task.STATUS_OVERDUE
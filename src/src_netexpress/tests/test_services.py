@@ -5,7 +5,6 @@ les cas où les données peuvent être manquantes (catégories, images, etc.).
 """
 
 import pytest
-from django.test import Client
 from django.urls import reverse
 
 from services.models import Service, Category
@@ -91,7 +90,10 @@ class TestServiceDetailView:
     """Tests pour la vue détail d'un service."""
 
     def test_service_detail_renders_successfully(self, client, service_with_category):
-        """La page détail d'un service doit s'afficher sans erreur 500."""
+        """La page détail d'un service doit s'afficher sans erreur 500, même sans image."""
+        # Le service n'a pas d'image par défaut
+        assert not service_with_category.image
+
         response = client.get(
             reverse('services:detail', kwargs={'slug': service_with_category.slug})
         )
@@ -107,17 +109,6 @@ class TestServiceDetailView:
         content = response.content.decode()
         assert service_with_category.category.name in content
 
-    def test_service_detail_handles_missing_image(self, client, service_with_category):
-        """Le détail doit gérer l'absence d'image."""
-        # Le service n'a pas d'image par défaut
-        assert not service_with_category.image
-        
-        response = client.get(
-            reverse('services:detail', kwargs={'slug': service_with_category.slug})
-        )
-        assert response.status_code == 200
-        # Le template devrait afficher une image par défaut
-
     def test_service_detail_shows_duration(self, client, service_with_category):
         """Le détail doit afficher la durée estimée."""
         response = client.get(